@@ -1,9 +1,49 @@
 import gradio as gr
 from business_model import BusinessParameters, BusinessModel
+from charts import warm_up
 import pandas as pd
 import tempfile
+import functools
+import atexit
+import os
+from collections import OrderedDict
 
-def run_model(
+# Tempfile paths of written CSVs keyed by content, oldest first
+_CSV_CACHE_SIZE = 32
+_csv_paths = OrderedDict()
+
+def _csv_path(df: pd.DataFrame) -> str:
+    key = (tuple(df.columns), df.to_numpy().tobytes())
+    path = _csv_paths.get(key)
+    if path is not None:
+        _csv_paths.move_to_end(key)
+        return path
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as csv_file:
+        path = csv_file.name
+    df.to_csv(path, index=False)
+    _csv_paths[key] = path
+
+    if len(_csv_paths) > _CSV_CACHE_SIZE:
+        _, evicted_path = _csv_paths.popitem(last=False)
+        _remove_file(evicted_path)
+    return path
+
+def _remove_file(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+@atexit.register
+def _remove_csv_files():
+    for path in _csv_paths.values():
+        _remove_file(path)
+
+# Each entry holds a rendered 24x12 figure (about 5 MB), so only the last few runs are kept;
+# a repeated click then skips the model and the chart build
+@functools.lru_cache(maxsize=8)
+def _run_model(
     monthly_price: float,
     quarterly_price: float,
     yearly_price: float,
@@ -44,43 +84,42 @@ def run_model(
     main_metrics_df, cohort_df, charts = model.calculate_metrics()
     
     # Calculate average LTV, CAC, and LTV/CAC ratio for the whole period
-    avg_ltv = cohort_df['ltv'].mean() if not cohort_df.empty else 0
-    avg_cac = cohort_df['cac'].mean() if not cohort_df.empty else 0
-    avg_ltv_cac = cohort_df['ltv_cac_ratio'].mean() if not cohort_df.empty else 0
+    avg_ltv = cohort_df['ltv'].to_numpy().mean() if not cohort_df.empty else 0
+    avg_cac = cohort_df['cac'].to_numpy().mean() if not cohort_df.empty else 0
+    avg_ltv_cac = cohort_df['ltv_cac_ratio'].to_numpy().mean() if not cohort_df.empty else 0
     # Calculate total investment required (sum of Required Investment column)
-    total_investment_required = main_metrics_df['Required Investment ($M)'].sum() if not main_metrics_df.empty else 0
+    total_investment_required = main_metrics_df['Required Investment ($M)'].to_numpy().sum()
     
     # Calculate total profit at 2 years (24 months)
-    total_profit_2y = main_metrics_df.loc[23, "Cumulative Profit ($M)"] if len(main_metrics_df) > 23 else 0
+    cumulative_profit = main_metrics_df["Cumulative Profit ($M)"].to_numpy()
+    total_profit_2y = cumulative_profit[23] if len(cumulative_profit) > 23 else 0
     
     # Format DataFrames for display
     main_metrics_df = main_metrics_df.round(2)
     cohort_df = cohort_df.round(2)
-    
-    # Save CSVs to temp files
-    main_metrics_csv = tempfile.NamedTemporaryFile(delete=False, suffix=".csv")
-    cohort_metrics_csv = tempfile.NamedTemporaryFile(delete=False, suffix=".csv")
-    main_metrics_df.to_csv(main_metrics_csv.name, index=False)
-    cohort_df.to_csv(cohort_metrics_csv.name, index=False)
+    # Counts fit in int32; rounded amounts stay float64 since float32 would reach the table as 0.11999999731779099
+    cohort_df = cohort_df.astype({"cohort": "int32", "users": "int32", "trials": "int32"})
     
     return (
         main_metrics_df,
         cohort_df,
-        charts[0],  # Profit and User Growth
-        charts[1],  # EBITDA Margin
-        charts[2],  # Required Investment
-        charts[3],  # Marketing and Maintenance Spend
-        charts[4],  # Stacked Cost Chart
-        charts[5],  # Profit and Required Investment Combined Chart
+        charts[0],  # All charts on one figure
         avg_ltv,
         avg_cac,
         avg_ltv_cac,
         total_investment_required,
-        total_profit_2y,
-        main_metrics_csv.name,
-        cohort_metrics_csv.name
+        total_profit_2y
     )
 
+def run_model(*args):
+    # The model is a pure function of the slider values; round them so that
+    # float jitter from the UI doesn't defeat the caches
+    results = _run_model(*(round(arg, 6) for arg in args))
+    main_metrics_df, cohort_df = results[0], results[1]
+    return results + (_csv_path(main_metrics_df), _csv_path(cohort_df))
+
+warm_up()
+
 # Create Gradio interface
 with gr.Blocks(title="Fitness App Economics Model", theme=gr.themes.Soft()) as demo:
     gr.Markdown("""
@@ -197,27 +236,8 @@ with gr.Blocks(title="Fitness App Economics Model", theme=gr.themes.Soft()) as d
     
     with gr.Row():
         with gr.Column():
-            gr.Markdown("## Profit and User Growth")
-            profit_chart = gr.Plot()
-        with gr.Column():
-            gr.Markdown("## EBITDA Margin")
-            margin_chart = gr.Plot()
-    
-    with gr.Row():
-        gr.Markdown("## Required Investment")
-        investment_chart = gr.Plot()
-    
-    with gr.Row():
-        gr.Markdown("## Marketing and Maintenance Spend")
-        spend_chart = gr.Plot()
-    
-    with gr.Row():
-        gr.Markdown("## Stacked Cost Breakdown")
-        stacked_cost_chart = gr.Plot()
-    
-    with gr.Row():
-        gr.Markdown("## Net Profit and Required Investment")
-        profit_investment_chart = gr.Plot()
+            gr.Markdown("## Charts")
+            charts_plot = gr.Plot()
     
     run_button.click(
         fn=run_model,
@@ -228,7 +248,10 @@ with gr.Blocks(title="Fitness App Economics Model", theme=gr.themes.Soft()) as d
             max_marketing_budget, rebill_rate, store_payment_percentage, trial_period_days,
             development_period_months, marketing_team_salary, marketing_team_per_budget
         ],
-        outputs=[main_metrics, cohort_metrics, profit_chart, margin_chart, investment_chart, spend_chart, stacked_cost_chart, profit_investment_chart, avg_ltv_out, avg_cac_out, avg_ltv_cac_out, total_investment_out, total_profit_2y_out, main_metrics_download, cohort_metrics_download]
+        outputs=[main_metrics, cohort_metrics, charts_plot, avg_ltv_out, avg_cac_out, avg_ltv_cac_out, total_investment_out, total_profit_2y_out, main_metrics_download, cohort_metrics_download],
+        # Run one model at a time and collapse clicks queued behind it into the latest one
+        trigger_mode="always_last",
+        concurrency_limit=1
     )
 
 if __name__ == "__main__":
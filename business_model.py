@@ -1,7 +1,11 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd
-import matplotlib.pyplot as plt
-from dataclasses import dataclass, field
+from matplotlib.figure import Figure
+from dataclasses import dataclass
+from collections import OrderedDict
+import threading
+from functools import lru_cache
 from typing import Tuple, List, Dict
 from charts import ChartCreator
 
@@ -11,7 +15,7 @@ class SubscriptionTier:
     price: float
     distribution: float  # Percentage of users who choose this tier
 
-@dataclass
+@dataclass(frozen=True)
 class BusinessParameters:
     # Required parameters (no default values)
     monthly_price: float
@@ -50,20 +54,86 @@ class BusinessParameters:
     quarterly_distribution: float = 0.20
     yearly_distribution: float = 0.10
     
-    seasonality_months: list = field(default_factory=lambda: [1])  # Only January
+    seasonality_months: tuple = (1,)  # Only January
     seasonality_cac_factor: float = 1.3  # CAC is 2x in January
     seasonality_install_to_trial_factor: float = 1.15  # install-to-trial is 1.15x in January
 
     def __post_init__(self):
+        # Parameters are hashable so model results can be cached per parameter set
+        object.__setattr__(self, "seasonality_months", tuple(self.seasonality_months))
+
         # Validate subscription distributions sum to 1
         total_distribution = self.monthly_distribution + self.quarterly_distribution + self.yearly_distribution
         if not np.isclose(total_distribution, 1.0):
             raise ValueError("Subscription tier distributions must sum to 1.0")
 
+def _simulate_acquisition(
+    marketing_budgets: np.ndarray,
+    current_cpi: np.ndarray,
+    install_to_trial: np.ndarray,
+    trial_to_paid_conversion: float,
+    market_size: int,
+    development_period_months: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Until the market cap binds every month is independent, so compute them all at once
+    installs = (marketing_budgets / current_cpi).astype(np.int64)
+    installs[:development_period_months] = 0
+    trials = (installs * install_to_trial).astype(np.int64)
+    new_paid_users = (trials * trial_to_paid_conversion).astype(np.int64)
+
+    # From the first month whose installs exceed the market left by earlier cohorts, the
+    # remaining market depends on every previous month, so only that suffix is replayed
+    remaining_market = market_size - (np.cumsum(new_paid_users) - new_paid_users)
+    saturated = np.flatnonzero(installs > remaining_market)
+    if saturated.size:
+        first_saturated = saturated[0]
+        total_users = market_size - remaining_market[first_saturated]
+        for i in range(first_saturated, len(installs)):
+            actual_installs = min(int(installs[i]), market_size - total_users)
+            new_trials = int(actual_installs * install_to_trial[i])
+            new_paid = int(new_trials * trial_to_paid_conversion)
+            installs[i] = actual_installs
+            trials[i] = new_trials
+            new_paid_users[i] = new_paid
+            total_users += new_paid
+
+    return installs, trials, new_paid_users
+
+@lru_cache(maxsize=128)
+def _retention_curve(months: int, rebill_rate: float) -> np.ndarray:
+    # Only depends on the rebill rate, so price and market changes reuse the cached curve
+    churn_rate = 1.0 / (1.0 + rebill_rate)
+    retention_rate = 1.0 - churn_rate
+    retention_curve = retention_rate ** np.arange(months)
+    retention_curve.setflags(write=False)
+    return retention_curve
+
+@lru_cache(maxsize=32)
+def _inflation_factors(months: int, monthly_discount_rate: float) -> np.ndarray:
+    # Per-month discount factors; only depend on the horizon and inflation rate.
+    # The sequence is geometric, so build it with a running product instead of a power per month
+    inflation_factors = np.full(months, 1.0 / (1.0 + monthly_discount_rate))
+    inflation_factors[:1] = 1.0
+    np.cumprod(inflation_factors, out=inflation_factors)
+    inflation_factors.setflags(write=False)
+    return inflation_factors
+
+def _build_cohort_matrix(cohort_revenue: np.ndarray, retention_curve: np.ndarray, conversion_delay: int) -> np.ndarray:
+    # Every cohort follows the same curve shifted by its start month, so the retention part is
+    # Toeplitz: row c is a window into the zero-padded curve, taken as a view without copying
+    months = len(cohort_revenue)
+    if months == 0:
+        return np.zeros((0, 0), dtype=cohort_revenue.dtype)
+    padded_curve = np.zeros(2 * months - 1, dtype=retention_curve.dtype)
+    padded_curve[months - 1 + conversion_delay:] = retention_curve[:max(months - conversion_delay, 0)]
+    retention = sliding_window_view(padded_curve, months)[::-1]
+    return cohort_revenue[:, None] * retention
+
 class BusinessModel:
     def __init__(self, params: BusinessParameters):
         self.params = params
         self.monthly_discount_rate = (1 + params.inflation_rate_annual) ** (1 / 12) - 1
+        self.inflation_factors = _inflation_factors(params.months, self.monthly_discount_rate)
         self.chart_creator = ChartCreator(params.months)
         
         # Initialize subscription tiers
@@ -72,208 +142,184 @@ class BusinessModel:
             SubscriptionTier(3, params.quarterly_price, params.quarterly_distribution),
             SubscriptionTier(12, params.yearly_price, params.yearly_distribution)
         ]
+        # Same tiers as parallel arrays, so per-cohort tier splits are single array ops
+        self.tier_prices = np.array([tier.price for tier in self.subscription_tiers], dtype=np.float64)
+        self.tier_distributions = np.array([tier.distribution for tier in self.subscription_tiers], dtype=np.float64)
+        self.average_price = float(self.tier_prices @ self.tier_distributions)
 
-    def calculate_marketing_and_acquisition(self) -> Tuple[List[int], List[int], List[int], List[int]]:
-        # Calculate marketing budgets with cap
-        marketing_budgets = []
-        current_budget = self.params.initial_marketing_budget
-        
-        for i in range(self.params.months):
-            if i < self.params.development_period_months:
-                marketing_budgets.append(0)
-            else:
-                current_budget = min(
-                    current_budget * (1 + self.params.marketing_growth_rate),
-                    self.params.max_marketing_budget
-                )
-                month_in_year = (i % 12) + 1
-                if month_in_year in self.params.seasonality_months:
-                    marketing_budgets.append(current_budget * 2)
-                else:
-                    marketing_budgets.append(current_budget)
-        
-        total_users = 0
-        installs = []
-        trials = []
-        new_paid_users = []
-        
-        for i in range(self.params.months):
-            if i < self.params.development_period_months:
-                installs.append(0)
-                trials.append(0)
-                new_paid_users.append(0)
-                continue
-            month_in_year = (i % 12) + 1
-            if month_in_year in self.params.seasonality_months:
-                current_cpi = self.params.base_cpi * self.params.seasonality_cac_factor
-                install_to_trial = min(self.params.install_to_trial_conversion * self.params.seasonality_install_to_trial_factor, 1.0)
-            else:
-                current_cpi = self.params.base_cpi
-                install_to_trial = self.params.install_to_trial_conversion
-            potential_installs = int(marketing_budgets[i] / current_cpi)
-            remaining_market = self.params.market_size - total_users
-            actual_installs = min(potential_installs, remaining_market)
-            new_trials = int(actual_installs * install_to_trial)
-            new_paid = int(new_trials * self.params.trial_to_paid_conversion)
-            installs.append(actual_installs)
-            trials.append(new_trials)
-            new_paid_users.append(new_paid)
-            total_users += new_paid
+    def calculate_marketing_and_acquisition(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # Calculate marketing budgets with cap: compounded growth from the initial budget,
+        # where a shrinking budget keeps decaying from the cap once it has been hit
+        growth = 1 + self.params.marketing_growth_rate
+        months_of_growth = np.arange(1, self.params.months - self.params.development_period_months + 1, dtype=np.float64)
+        marketing_budgets = np.zeros(self.params.months)
+        marketing_budgets[self.params.development_period_months:] = np.minimum(
+            self.params.initial_marketing_budget * np.power(growth, months_of_growth),
+            self.params.max_marketing_budget * np.power(min(growth, 1.0), months_of_growth - 1)
+        )
+
+        # Seasonal months double the budget and shift CPI and install-to-trial conversion
+        month_in_year = (np.arange(self.params.months) % 12) + 1
+        is_seasonal = np.isin(month_in_year, np.asarray(self.params.seasonality_months))
+        marketing_budgets[is_seasonal] *= 2
+        current_cpi = np.where(
+            is_seasonal,
+            self.params.base_cpi * self.params.seasonality_cac_factor,
+            self.params.base_cpi
+        )
+        install_to_trial = np.where(
+            is_seasonal,
+            min(self.params.install_to_trial_conversion * self.params.seasonality_install_to_trial_factor, 1.0),
+            self.params.install_to_trial_conversion
+        )
+
+        installs, trials, new_paid_users = _simulate_acquisition(
+            marketing_budgets,
+            current_cpi,
+            install_to_trial,
+            self.params.trial_to_paid_conversion,
+            self.params.market_size,
+            self.params.development_period_months
+        )
         
         return marketing_budgets, installs, trials, new_paid_users
 
-    def calculate_cohort_matrix(self, new_paid_users: List[int], trials: List[int]) -> np.ndarray:
-        cohort_matrix = np.zeros((self.params.months, self.params.months))
-        trial_matrix = np.zeros((self.params.months, self.params.months))
-        
+    def calculate_cohort_matrix(self, new_paid_users: np.ndarray, trials: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         # Calculate trial days per month (approximate)
         trial_months = self.params.trial_period_days / 30.44  # Average days in a month
+
+        # Trial users of a cohort are active from install through the end of the trial window,
+        # so active trials per month are the cohort trials summed over a sliding box window
+        trial_users = np.asarray(trials, dtype=np.int64)
+        cohort_trials = (trial_users[:, None] * self.tier_distributions).astype(np.int64).sum(axis=1)
+        trial_window = np.ones(int(trial_months) + 1)
+        if self.params.months > 0:
+            active_trials = np.convolve(cohort_trials.astype(np.float64), trial_window)[:self.params.months]
+        else:
+            # np.convolve rejects empty input
+            active_trials = np.zeros(0)
+
+        # Churn-based active user and revenue modeling
+        # Monthly revenue of a cohort right after conversion, summed over tiers
+        paid_users = np.asarray(new_paid_users, dtype=np.int64)
+        tier_paid = (paid_users[:, None] * self.tier_distributions).astype(np.int64)
+        cohort_revenue = (tier_paid @ self.tier_prices).astype(np.float32)
+
+        # Paid months start after the trial period; retention depends only on months since conversion
+        retention_curve = _retention_curve(self.params.months, self.params.rebill_rate)
+        # The matrix is float32 to halve its footprint; reductions over it accumulate in float64
+        cohort_matrix = _build_cohort_matrix(cohort_revenue, retention_curve.astype(np.float32), int(trial_months))
+
+        return cohort_matrix, active_trials
+
+    def calculate_metrics(self) -> Tuple[pd.DataFrame, pd.DataFrame, List[Figure]]:
+        main_metrics_df, cohort_df, cost_components = _cached_frames(self)
+        # The cached frames are shared between calls, so callers get their own copies
+        main_metrics_df = main_metrics_df.copy()
+        cohort_df = cohort_df.copy()
+
+        # Create charts using the ChartCreator
+        charts = self.chart_creator.create_all_charts(main_metrics_df, cost_components)
         
-        # Calculate churn rate from rebill rate
-        churn_rate = 1.0 / (1.0 + self.params.rebill_rate)
-        retention_rate = 1.0 - churn_rate
-        
-        for cohort in range(self.params.months):
-            trial_users = trials[cohort]
-            paid_users = new_paid_users[cohort]
-            
-            if trial_users == 0 and paid_users == 0:
-                continue
-                
-            # Distribute users across subscription tiers
-            tier_trials = {
-                tier: int(trial_users * tier.distribution)
-                for tier in self.subscription_tiers
-            }
-            
-            tier_paid = {
-                tier: int(paid_users * tier.distribution)
-                for tier in self.subscription_tiers
-            }
-            
-            # Calculate trial period
-            for tier in self.subscription_tiers:
-                trial_user_count = tier_trials[tier]
-                if trial_user_count > 0:
-                    for m in range(cohort, min(cohort + int(trial_months) + 1, self.params.months)):
-                        trial_matrix[cohort][m] += trial_user_count
-            
-            # Churn-based active user and revenue modeling
-            for tier in self.subscription_tiers:
-                paid_user_count = tier_paid[tier]
-                if paid_user_count == 0:
-                    continue
-                start_month = cohort + int(trial_months)  # Start after trial period
-                for m in range(start_month, self.params.months):
-                    months_since_conversion = m - start_month
-                    active_users = paid_user_count * (retention_rate ** months_since_conversion)
-                    cohort_matrix[cohort][m] += active_users * tier.price
-        
-        return cohort_matrix, trial_matrix
+        return main_metrics_df, cohort_df, charts
 
-    def calculate_metrics(self) -> Tuple[pd.DataFrame, pd.DataFrame, List[plt.Figure]]:
+    def _calculate_frames(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         marketing_budgets, installs, trials, new_paid_users = self.calculate_marketing_and_acquisition()
-        cohort_matrix, trial_matrix = self.calculate_cohort_matrix(new_paid_users, trials)
+        cohort_matrix, active_trials = self.calculate_cohort_matrix(new_paid_users, trials)
         
-        monthly_revenue = cohort_matrix.sum(axis=0)
+        monthly_revenue = cohort_matrix.sum(axis=0, dtype=np.float64)
+        # Revenue mixes all tiers, so convert it back to users at the distribution-weighted price
+        active_paid_users = np.rint(monthly_revenue / self.average_price).astype(np.int64)
         # Subtract refunds
-        refunds = monthly_revenue * self.params.refund_rate
-        monthly_revenue = monthly_revenue - refunds
-        active_trials = trial_matrix.sum(axis=0)
-        active_paid_users = [int(np.sum(cohort_matrix[:, i] / self.params.monthly_price)) 
-                           for i in range(self.params.months)]
+        monthly_revenue = monthly_revenue * (1 - self.params.refund_rate)
+        post_development = np.arange(self.params.months) >= self.params.development_period_months
         
         # Calculate development costs (ongoing for all months)
-        development_costs = [
-            self.params.developer_salary * self.params.developer_count 
-            for i in range(self.params.months)
-        ]
+        development_costs = np.full(self.params.months, self.params.developer_salary * self.params.developer_count)
         
         # Calculate ML team costs
-        ml_developer_costs = [
-            self.params.ml_developer_salary * (self.params.ml_developer_count_initial if i < self.params.development_period_months else self.params.ml_developer_count_ongoing)
-            for i in range(self.params.months)
-        ]
+        ml_developer_costs = self.params.ml_developer_salary * np.where(
+            post_development,
+            self.params.ml_developer_count_ongoing,
+            self.params.ml_developer_count_initial
+        )
         
         # Calculate operational costs (start after development period)
-        operational_costs = [
-            self.params.monthly_operational_cost if i >= self.params.development_period_months else 0
-            for i in range(self.params.months)
-        ]
+        operational_costs = np.where(post_development, self.params.monthly_operational_cost, 0.0)
         
         # Calculate maintenance costs (including trial users, start after development period)
-        maintenance_costs = [
-            self.params.per_user_maintenance_cost * (active_paid_users[i] + active_trials[i])
-            if i >= self.params.development_period_months else 0
-            for i in range(self.params.months)
-        ]
+        maintenance_costs = np.where(
+            post_development,
+            self.params.per_user_maintenance_cost * (active_paid_users + active_trials),
+            0.0
+        )
         
         # Calculate marketing team size and cost
-        marketing_team_size = [
-            int(np.ceil(marketing_budgets[i] / self.params.marketing_team_per_budget)) if marketing_budgets[i] > 0 else 0
-            for i in range(self.params.months)
-        ]
-        marketing_team_costs = [
-            marketing_team_size[i] * self.params.marketing_team_salary
-            for i in range(self.params.months)
-        ]
+        marketing_team_size = np.where(
+            marketing_budgets > 0,
+            np.ceil(marketing_budgets / self.params.marketing_team_per_budget),
+            0
+        ).astype(np.int64)
+        marketing_team_costs = marketing_team_size * self.params.marketing_team_salary
         
-        total_cost = (np.array(marketing_budgets) + 
-                     np.array(development_costs) + 
-                     np.array(ml_developer_costs) +
-                     np.array(operational_costs) + 
-                     np.array(maintenance_costs) +
-                     np.array(marketing_team_costs))
+        total_cost = (marketing_budgets + 
+                     development_costs + 
+                     ml_developer_costs +
+                     operational_costs + 
+                     maintenance_costs +
+                     marketing_team_costs)
         
         # Calculate store commission only on store payments
-        store_commission = monthly_revenue * self.params.store_commission_rate * self.params.store_payment_percentage
-        net_revenue = monthly_revenue - store_commission
+        # (scalar rates are combined first so each result takes a single pass over the months)
+        store_commission_share = self.params.store_commission_rate * self.params.store_payment_percentage
+        net_revenue = monthly_revenue * (1 - store_commission_share)
         operating_profit_net = net_revenue - total_cost
-        ebitda = net_revenue - np.array(marketing_budgets) - np.array(maintenance_costs)
+        ebitda = net_revenue - marketing_budgets
+        ebitda -= maintenance_costs
         cumulative_profit_net = np.cumsum(operating_profit_net)
         
-        inflation_factors = [(1 / ((1 + self.monthly_discount_rate) ** i)) 
-                           for i in range(self.params.months)]
-        inflation_adjusted_profit = operating_profit_net * inflation_factors
+        inflation_adjusted_profit = operating_profit_net * self.inflation_factors
 
-        # Calculate rolling required investment (cash buffer)
-        rolling_required_investment = []
-        cumulative_profit = 0
-        for i in range(self.params.months):
-            cumulative_profit += operating_profit_net[i]
-            if cumulative_profit < 0:
-                rolling_required_investment.append(-cumulative_profit)
-                cumulative_profit = 0
-            else:
-                rolling_required_investment.append(0)
+        # Calculate rolling required investment (cash buffer): the running balance is topped back
+        # up to zero whenever it goes negative, so each month's shortfall is measured from the
+        # lowest cumulative profit reached before it
+        previous_low = np.minimum.accumulate(np.concatenate(([0.0], cumulative_profit_net[:-1])))
+        rolling_required_investment = np.maximum(previous_low - cumulative_profit_net, 0.0)
 
         # Create main metrics DataFrame
-        main_metrics_df = pd.DataFrame({
-            "Month": range(1, self.params.months + 1),
-            "Net Revenue ($M)": net_revenue / 1e6,
-            "Total Cost ($M)": total_cost / 1e6,
-            "Marketing Spend ($M)": np.array(marketing_budgets) / 1e6,
-            "Development Cost ($M)": np.array(development_costs) / 1e6,
-            "ML Team Cost ($M)": np.array(ml_developer_costs) / 1e6,
-            "Marketing Team Cost ($M)": np.array(marketing_team_costs) / 1e6,
-            "Operational Cost ($M)": np.array(operational_costs) / 1e6,
-            "Maintenance Cost ($M)": np.array(maintenance_costs) / 1e6,
-            "Cumulative Marketing ($M)": np.cumsum(marketing_budgets) / 1e6,
-            "Net Profit ($M)": operating_profit_net / 1e6,
-            "EBITDA ($M)": ebitda / 1e6,
-            "EBITDA Margin (%)": np.round(np.divide(ebitda, net_revenue, out=np.zeros_like(ebitda), where=net_revenue!=0) * 100, 1),
-            "Inflation Adjusted Profit ($M)": inflation_adjusted_profit / 1e6,
-            "Cumulative Profit ($M)": cumulative_profit_net / 1e6,
-            "Required Investment ($M)": np.array(rolling_required_investment) / 1e6,
-            "Active Users (K)": [u/1000 for u in active_paid_users],
-            "Active Trials (K)": [t/1000 for t in active_trials],
-            "New Users (K)": [u/1000 for u in new_paid_users],
-            "New Trials (K)": [t/1000 for t in trials]
-        })
+        month_numbers = np.arange(1, self.params.months + 1, dtype=np.int32)
+
+        # Column name, values and unit divisor. All metrics go into one float64 block, scaled in
+        # a single pass, so the frame is one contiguous allocation instead of a copy per column
+        metric_columns = [
+            ("Net Revenue ($M)", net_revenue, 1e6),
+            ("Total Cost ($M)", total_cost, 1e6),
+            ("Marketing Spend ($M)", marketing_budgets, 1e6),
+            ("Development Cost ($M)", development_costs, 1e6),
+            ("ML Team Cost ($M)", ml_developer_costs, 1e6),
+            ("Marketing Team Cost ($M)", marketing_team_costs, 1e6),
+            ("Operational Cost ($M)", operational_costs, 1e6),
+            ("Maintenance Cost ($M)", maintenance_costs, 1e6),
+            ("Cumulative Marketing ($M)", np.cumsum(marketing_budgets), 1e6),
+            ("Net Profit ($M)", operating_profit_net, 1e6),
+            ("EBITDA ($M)", ebitda, 1e6),
+            ("EBITDA Margin (%)", np.round(np.divide(ebitda, net_revenue, out=np.zeros_like(ebitda), where=net_revenue!=0) * 100, 1), 1),
+            ("Inflation Adjusted Profit ($M)", inflation_adjusted_profit, 1e6),
+            ("Cumulative Profit ($M)", cumulative_profit_net, 1e6),
+            ("Required Investment ($M)", rolling_required_investment, 1e6),
+            ("Active Users (K)", active_paid_users, 1000),
+            ("Active Trials (K)", active_trials, 1000),
+            ("New Users (K)", new_paid_users, 1000),
+            ("New Trials (K)", trials, 1000)
+        ]
+        metrics_block = np.column_stack([values for _, values, _ in metric_columns]).astype(np.float64, copy=False)
+        metrics_block /= np.array([divisor for _, _, divisor in metric_columns], dtype=np.float64)
+        main_metrics_df = pd.DataFrame(metrics_block, columns=[name for name, _, _ in metric_columns], copy=False)
+        main_metrics_df.insert(0, "Month", month_numbers)
 
         # For stacked cost chart
-        cost_components = pd.DataFrame({
-            "Month": range(1, self.params.months + 1),
+        cost_components = pd.DataFrame.from_dict({
+            "Month": month_numbers,
             "Marketing": marketing_budgets,
             "Development": development_costs,
             "ML Team": ml_developer_costs,
@@ -281,29 +327,41 @@ class BusinessModel:
             "Operations": operational_costs,
             "User Maintenance": maintenance_costs,
             "Revenue": monthly_revenue
-        })
+        }, orient="columns")
 
         # Calculate cohort metrics
-        cohort_metrics = []
-        for cohort in range(self.params.months):
-            users = new_paid_users[cohort]
-            if users > 0:
-                total_revenue = np.sum(cohort_matrix[cohort])
-                ltv = total_revenue / users  # Net revenue per paid user
-                marketing_spend = marketing_budgets[cohort]
-                cac = marketing_spend / users  # CAC: marketing spend per paid user
-                cohort_metrics.append({
-                    'cohort': cohort + 1,
-                    'users': users,
-                    'trials': trials[cohort],
-                    'ltv': ltv,
-                    'cac': cac,
-                    'ltv_cac_ratio': ltv / cac if cac > 0 else 0
-                })
+        converted = new_paid_users > 0
+        users = new_paid_users[converted]
+        ltv = cohort_matrix.sum(axis=1, dtype=np.float64)[converted] / users  # Net revenue per paid user
+        cac = marketing_budgets[converted] / users  # CAC: marketing spend per paid user
+        cohort_df = pd.DataFrame({
+            'cohort': np.flatnonzero(converted) + 1,
+            'users': users,
+            'trials': trials[converted],
+            'ltv': ltv,
+            'cac': cac,
+            'ltv_cac_ratio': np.divide(ltv, cac, out=np.zeros_like(ltv), where=cac > 0)
+        })
 
-        cohort_df = pd.DataFrame(cohort_metrics)
-        
-        # Create charts using the ChartCreator
-        charts = self.chart_creator.create_all_charts(main_metrics_df, cost_components)
-        
-        return main_metrics_df, cohort_df, charts 
\ No newline at end of file
+        return main_metrics_df, cohort_df, cost_components
+
+# Model frames keyed by their (frozen, hashable) parameters, oldest first. The lock keeps
+# lookup and eviction atomic when models run on several threads
+_FRAMES_CACHE_SIZE = 128
+_frames_cache = OrderedDict()
+_frames_lock = threading.Lock()
+
+def _cached_frames(model: BusinessModel) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    with _frames_lock:
+        frames = _frames_cache.get(model.params)
+        if frames is not None:
+            _frames_cache.move_to_end(model.params)
+            return frames
+
+    # Computed outside the lock so runs with other parameters aren't serialised behind it
+    frames = model._calculate_frames()
+    with _frames_lock:
+        _frames_cache[model.params] = frames
+        if len(_frames_cache) > _FRAMES_CACHE_SIZE:
+            _frames_cache.popitem(last=False)
+    return frames
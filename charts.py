@@ -1,93 +1,90 @@
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 
+def warm_up():
+    # Load fonts and the Agg renderer up front so the first model run doesn't pay for it
+    fig = Figure(figsize=(1, 1))
+    fig.add_subplot().set_title('Month')
+    FigureCanvasAgg(fig).draw()
+
 class ChartCreator:
     def __init__(self, months: int):
         self.months_range = range(1, months + 1)
         self.figures = []
 
     def create_all_charts(self, df, cost_components=None) -> list:
-        self._create_profit_chart(df)
-        self._create_margin_chart(df)
-        self._create_investment_chart(df)
-        self._create_spend_chart(df)
+        # All charts share one figure so the canvas and fonts are set up once per run
+        fig = Figure(figsize=(24, 12))
+        axes = fig.subplots(2, 3)
+        self._plot_profit(axes[0, 0], df)
+        self._plot_lines(axes[0, 1], df, 'EBITDA Margin Over Time', 'EBITDA Margin (%)', [
+            ("EBITDA Margin (%)", 'g-', None)
+        ])
+        self._plot_lines(axes[0, 2], df, 'Required Investment Over Time', 'Required Investment ($M)', [
+            ("Required Investment ($M)", 'r-', None)
+        ])
+        self._plot_lines(axes[1, 0], df, 'Marketing and Maintenance Spend Over Time', 'Cost ($M)', [
+            ("Marketing Spend ($M)", 'b-', 'Marketing'),
+            ("Development Cost ($M)", 'g-', 'Development'),
+            ("Operational Cost ($M)", 'y-', 'Operational'),
+            ("Maintenance Cost ($M)", 'r-', 'Maintenance')
+        ])
         if cost_components is not None:
-            self._create_stacked_cost_chart(cost_components)
-        self._create_profit_investment_chart(df)
+            self._plot_stacked_cost(axes[1, 1], cost_components)
+        else:
+            axes[1, 1].set_axis_off()
+        self._plot_profit_investment(axes[1, 2], df)
+        # Fixed margins for the 2x3 grid; tight_layout would re-measure every axis on each run
+        fig.subplots_adjust(left=0.04, right=0.97, bottom=0.06, top=0.96, wspace=0.22, hspace=0.22)
+        self.figures = [fig]
         return self.figures
 
-    def _create_profit_chart(self, df):
-        fig, ax1 = plt.subplots(figsize=(10, 6))
-        
+    def _plot_profit(self, ax1, df):
         # Plot profit on primary y-axis
         ax1.plot(self.months_range, df["Net Profit ($M)"], 'b-', label='Net Profit')
         ax1.set_xlabel('Month')
         ax1.set_ylabel('Profit ($M)', color='b')
         ax1.tick_params(axis='y', labelcolor='b')
-        
+
         # Create secondary y-axis for users
         ax2 = ax1.twinx()
         ax2.plot(self.months_range, df["Active Users (K)"], 'r-', label='Active Users')
         ax2.set_ylabel('Active Users (K)', color='r')
         ax2.tick_params(axis='y', labelcolor='r')
-        
-        plt.title('Profit and User Growth Over Time')
-        fig.tight_layout()
-        self.figures.append(fig)
-
-    def _create_margin_chart(self, df):
-        plt.figure(figsize=(10, 6))
-        plt.plot(self.months_range, df["EBITDA Margin (%)"], 'g-')
-        plt.xlabel('Month')
-        plt.ylabel('EBITDA Margin (%)')
-        plt.title('EBITDA Margin Over Time')
-        plt.grid(True)
-        self.figures.append(plt.gcf())
 
-    def _create_investment_chart(self, df):
-        plt.figure(figsize=(10, 6))
-        plt.plot(self.months_range, df["Required Investment ($M)"], 'r-')
-        plt.xlabel('Month')
-        plt.ylabel('Required Investment ($M)')
-        plt.title('Required Investment Over Time')
-        plt.grid(True)
-        self.figures.append(plt.gcf())
+        ax1.set_title('Profit and User Growth Over Time')
 
-    def _create_spend_chart(self, df):
-        plt.figure(figsize=(10, 6))
-        plt.plot(self.months_range, df["Marketing Spend ($M)"], 'b-', label='Marketing')
-        plt.plot(self.months_range, df["Development Cost ($M)"], 'g-', label='Development')
-        plt.plot(self.months_range, df["Operational Cost ($M)"], 'y-', label='Operational')
-        plt.plot(self.months_range, df["Maintenance Cost ($M)"], 'r-', label='Maintenance')
-        plt.xlabel('Month')
-        plt.ylabel('Cost ($M)')
-        plt.title('Marketing and Maintenance Spend Over Time')
-        plt.legend()
-        plt.grid(True)
-        self.figures.append(plt.gcf())
+    def _plot_lines(self, ax, df, title, ylabel, series):
+        # series: (column, line style, legend label or None) per line
+        for column, style, label in series:
+            ax.plot(self.months_range, df[column], style, label=label)
+        ax.set_xlabel('Month')
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        if any(label for _, _, label in series):
+            ax.legend()
+        ax.grid(True)
 
-    def _create_stacked_cost_chart(self, cost_df):
-        plt.figure(figsize=(12, 7))
+    def _plot_stacked_cost(self, ax, cost_df):
         labels = ["Marketing", "Development", "Marketing Team", "Operations", "User Maintenance"]
         data = [cost_df[label] / 1e6 for label in labels]
-        plt.stackplot(cost_df["Month"], data, labels=labels)
+        ax.stackplot(cost_df["Month"], data, labels=labels)
         # Plot revenue as a line
-        plt.plot(cost_df["Month"], cost_df["Revenue"] / 1e6, color='black', linewidth=2, label='Revenue')
-        plt.xlabel('Month')
-        plt.ylabel('Amount ($M)')
-        plt.title('Stacked Cost Breakdown and Revenue Over Time')
-        plt.legend(loc='upper left')
-        plt.grid(True, axis='y', linestyle='--', alpha=0.7)
-        self.figures.append(plt.gcf())
+        ax.plot(cost_df["Month"], cost_df["Revenue"] / 1e6, color='black', linewidth=2, label='Revenue')
+        ax.set_xlabel('Month')
+        ax.set_ylabel('Amount ($M)')
+        ax.set_title('Stacked Cost Breakdown and Revenue Over Time')
+        ax.legend(loc='upper left')
+        ax.grid(True, axis='y', linestyle='--', alpha=0.7)
 
-    def _create_profit_investment_chart(self, df):
-        plt.figure(figsize=(12, 7))
-        plt.bar(df["Month"], df["Net Profit ($M)"], color='tab:blue', alpha=0.6, label='Net Profit ($M)')
-        plt.bar(df["Month"], -df["Required Investment ($M)"], color='tab:red', alpha=0.4, label='Required Investment ($M, negative)')
-        plt.xlabel('Month')
-        plt.ylabel('Amount ($M)')
-        plt.title('Monthly Net Profit and Required Investment')
-        plt.legend()
-        plt.grid(True, axis='y', linestyle='--', alpha=0.7)
-        plt.tight_layout()
-        self.figures.append(plt.gcf()) 
\ No newline at end of file
+    def _plot_profit_investment(self, ax, df):
+        ax.bar(df["Month"], df["Net Profit ($M)"], color='tab:blue', alpha=0.6, label='Net Profit ($M)')
+        ax.bar(df["Month"], -df["Required Investment ($M)"], color='tab:red', alpha=0.4, label='Required Investment ($M, negative)')
+        ax.set_xlabel('Month')
+        ax.set_ylabel('Amount ($M)')
+        ax.set_title('Monthly Net Profit and Required Investment')
+        ax.legend()
+        ax.grid(True, axis='y', linestyle='--', alpha=0.7)